@@ -4,22 +4,75 @@ DataBridge - 데이터 통신 허브
 """
 
 import json
-from typing import Dict, List, Optional, Any
-from PyQt5.QtCore import QObject, pyqtSignal
+import logging
+import operator
+import struct
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Any
+
+import numpy as np
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+try:
+    import orjson  # C 기반 JSON 인코더 (없으면 표준 json 사용)
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow.csv as pacsv  # 멀티스레드 C++ CSV 파서 (없으면 pandas 사용)
+except ImportError:
+    pacsv = None
 
 from utils.constants import (
     DEFAULT_MAX_ACCELERATION, DEFAULT_MAX_DECELERATION,
     DEFAULT_SEGMENTS, DEFAULT_FPS, DEFAULT_UNIFORM_MOTION_THRESHOLD
 )
+import data_bridge_kernels
+
+logger = logging.getLogger(__name__)
+
+# 스냅샷 빌드용 셀 추출자 (dict.get 4회 대신 C 레벨 일괄 조회)
+_get_snapshot_cells = operator.itemgetter(
+    'frame_start', 'frame_end', 'distance', 'avg_velocity'
+)
+
+# 그래프 계산이 구간 dict에 채워 넣는 파생 컬럼 (테이블 입력에는 없음)
+_COMPUTED_SEGMENT_FIELDS = (
+    'duration', 'avg_velocity', 'avg_time',
+    'acc_time', 'acc_velocity', 'acceleration', 'acc_dec_type'
+)
+
+class _Coefficients(NamedTuple):
+    """구간별 거리 제약 상수 배열 묶음 (SoA)"""
+    m: np.ndarray           # 거리 제약 상수 m_i = 2s_i/Δt_i (km/h)
+    duration: np.ndarray    # 구간 지속시간 (s)
+    distance: np.ndarray    # 구간 거리 (m)
+    start_time: np.ndarray  # 구간 시작시간 (s)
+
+class _LinearParams(NamedTuple):
+    """앵커 선형식 v_i(w) = A_i·w + B_i 계수 배열 묶음"""
+    A: np.ndarray
+    B: np.ndarray
+
+@lru_cache(maxsize=1024)
+def _parse_float_str(value: str) -> Optional[float]:
+    """문자열 → float 변환 (동일 문자열 반복 파싱 캐시)"""
+    try:
+        stripped = value.strip()
+        return float(stripped) if stripped else None
+    except ValueError:
+        return None
 
 class DataBridge(QObject):
     """데이터 통신 허브 클래스"""
     
     # 시그널 정의
-    data_changed = pyqtSignal(dict)  # 데이터 변경 시그널
-    table_data_updated = pyqtSignal(dict)  # 테이블 데이터 업데이트
-    graph_data_updated = pyqtSignal(dict)  # 그래프 데이터 업데이트
+    # dict 대신 object 선언: 메타타입 변환 없이 참조로 전달 (대용량 graph_data 방출 비용 절감)
+    data_changed = pyqtSignal(object)  # 데이터 변경 시그널
+    table_data_updated = pyqtSignal(object)  # 테이블 데이터 업데이트
+    graph_data_updated = pyqtSignal(object)  # 그래프 데이터 업데이트
     error_occurred = pyqtSignal(str)  # 에러 발생 시그널
+    settings_changed = pyqtSignal(object)  # 설정 변경 시그널
     
     def __init__(self):
         super().__init__()
@@ -37,6 +90,15 @@ class DataBridge(QObject):
         self._linear_params = None        # A_i, B_i 계수들
         self._anchor_index = 0           # 앵커 포인트 인덱스
         self._current_anchor_velocity = None  # 현재 앵커 속도값
+        self._opt_points = None           # 최적화 포인트 (n, 2) [time, velocity] 배열 캐시
+        self._anchor_scratch = None       # 앵커 드래그용 (2n, 2) 재사용 버퍼
+
+        # 그래프 재계산 메모이제이션 (입력 지문이 같으면 재계산 생략)
+        self._graph_cache_key = None
+        self._enriched_segments = None  # 파생 컬럼이 채워진 마지막 구간 리스트
+
+        # 그래프 시그널 병합 방출 (16ms 내 연속 업데이트를 한 번으로 합침)
+        self._emit_pending = False
         
 
     
@@ -97,11 +159,6 @@ class DataBridge(QObject):
             
             # 세그먼트 데이터 업데이트
             if 'segments' in table_data:
-                segments = table_data['segments']
-
-                for i, segment in enumerate(segments):
-                    pass
-
                 self._project_data['segments'] = table_data['segments']
             
             # 설정 데이터 업데이트
@@ -115,12 +172,11 @@ class DataBridge(QObject):
             self._unsaved_changes = True
             
             # 그래프 윈도우에 업데이트 알림
-            self.graph_data_updated.emit(self._project_data['graph_data'])
+            self._schedule_graph_emit()
             
 
             
         except Exception as e:
-            pass
             self.error_occurred.emit(f"테이블 데이터 업데이트 중 오류: {e}")
     
     def update_from_graph(self, graph_data: Dict[str, Any]):
@@ -129,12 +185,21 @@ class DataBridge(QObject):
             # 최적화 속도 데이터 업데이트
             if 'optimization_velocity' in graph_data:
                 self._project_data['graph_data']['optimization_velocity'] = graph_data['optimization_velocity']
-                
+
+                # 내부 배열 캐시 갱신 (그래프에서 온 dict 리스트를 한 번만 변환)
+                self._opt_points = np.array(
+                    [[p['time'], p['velocity']] for p in graph_data['optimization_velocity']],
+                    dtype=np.float64
+                ).reshape(-1, 2)
+
                 # 앵커 시스템이 초기화된 경우, 첫 번째 포인트를 기준으로 앵커 속도 추출
-                if (self._linear_coefficients and self._linear_params and 
+                if (self._linear_coefficients is not None and self._linear_params is not None and
                     graph_data['optimization_velocity']):
                     first_point = graph_data['optimization_velocity'][0]
                     self._current_anchor_velocity = first_point['velocity']
+
+                # 앵커 변경은 테이블 입력과 무관하므로 그래프 캐시 무효화
+                self._graph_cache_key = None
             
             # 테이블 데이터 역산 및 업데이트
             self._update_table_from_optimization_data()
@@ -146,167 +211,213 @@ class DataBridge(QObject):
             self.table_data_updated.emit({'segments': self._project_data['segments'], 'graph_updated': True})
             
             # 7열 시계열 업데이트를 위한 그래프 데이터 신호 발행
-            self.graph_data_updated.emit(self._project_data['graph_data'])
+            self._schedule_graph_emit()
             
 
             
         except Exception as e:
-            pass
             self.error_occurred.emit(f"그래프 데이터 업데이트 중 오류: {e}")
     
+    def _schedule_graph_emit(self):
+        """그래프 업데이트 시그널 병합 예약 (16ms 버스트를 한 번의 방출로 합침)"""
+        if not self._emit_pending:
+            self._emit_pending = True
+            QTimer.singleShot(16, self._flush_graph_emit)
+
+    def _flush_graph_emit(self):
+        """예약된 그래프 업데이트 시그널 방출 - 항상 최신 상태를 전달"""
+        self._emit_pending = False
+        payload = dict(self._project_data['graph_data'])
+        if self._opt_points is not None and self._opt_points.size:
+            # 수신 측의 dict 리스트 재순회를 피하도록 SoA 배열도 함께 전달
+            # (_project_data에는 넣지 않아 프로젝트 직렬화에는 영향 없음)
+            payload['opt_t'] = self._opt_points[:, 0]
+            payload['opt_v'] = self._opt_points[:, 1]
+        self.graph_data_updated.emit(payload)
+
+    def _graph_input_fingerprint(self, snapshot, fps):
+        """그래프 계산 입력의 지문 생성 (메모이제이션 키)
+
+        float 튜플 해시 대신 bytes 키 사용 -
+        원소별 해시 디스패치 없이 단일 패스로 해시된다.
+        avg_velocity(3열)도 video_analysis 계산 입력이므로 전체 열 포함.
+        """
+        return struct.pack('d', self._parse_float(fps)) + snapshot.tobytes()
+
+    def _build_segment_snapshot(self, segments):
+        """구간 dict 리스트를 (n, 4) float64 스냅샷으로 1회 파싱
+
+        열 순서: frame_start, frame_end, distance, avg_velocity.
+        이후 계산 단계들은 이 배열을 공유해 구간별 재파싱을 피한다.
+        """
+        pf = self._parse_float
+        try:
+            # itemgetter로 4개 셀을 C 호출 한 번에 추출 (.get 4회 대비)
+            return np.array([
+                [pf(v) for v in _get_snapshot_cells(s)] for s in segments
+            ], dtype=np.float64).reshape(-1, 4)
+        except KeyError:
+            # 외부에서 로드된 프로젝트 등 키가 빠진 구간 dict 대응
+            return np.array([
+                (pf(s.get('frame_start', 0)), pf(s.get('frame_end', 0)),
+                 pf(s.get('distance', 0)), pf(s.get('avg_velocity', 0)))
+                for s in segments
+            ], dtype=np.float64).reshape(-1, 4)
+
     def _calculate_graph_data(self):
         """테이블 데이터를 기반으로 그래프 데이터 계산"""
         try:
             # 기존 최적화 속도 데이터 초기화
             optimization_velocity = []
             video_analysis_velocity = []
-            
+
             current_time = 0.0
             fps = self._project_data['settings']['fps']
-            
+
             segments = self._project_data['segments']
 
-            
-            for i, segment in enumerate(segments):
-                # 구간 데이터 추출
-                frame_start = self._parse_float(segment.get('frame_start', 0))
-                frame_end = self._parse_float(segment.get('frame_end', 0))
-                distance = self._parse_float(segment.get('distance', 0))
-                avg_time = self._parse_float(segment.get('avg_time', 0))
-                avg_velocity = self._parse_float(segment.get('avg_velocity', 0))
-                
+            # 구간 셀 파싱은 여기서 한 번만 수행하고 이후 단계에 공유
+            snapshot = self._build_segment_snapshot(segments)
 
+            # 동일 입력에 대한 중복 재계산 방지 (PyQt 중복 시그널 대응)
+            cache_key = self._graph_input_fingerprint(snapshot, fps)
+            if cache_key == self._graph_cache_key:
+                # 테이블이 보낸 새 dict 리스트에는 파생 컬럼이 없으므로
+                # 이전 계산 결과를 옮겨 담아야 저장/리로드 시 유실되지 않음
+                self._restore_computed_fields(segments)
+                return
+            self._graph_cache_key = cache_key
+
+
+            for i in range(snapshot.shape[0]):
+                # 구간 데이터 추출 (스냅샷 열: frame_start, frame_end, distance, avg_velocity)
+                frame_start = snapshot[i, 0]
+                frame_end = snapshot[i, 1]
+                avg_velocity = snapshot[i, 3]
 
-                acc_time = self._parse_float(segment.get('acc_time', 0))
-                acc_velocity = self._parse_float(segment.get('acc_velocity', 0))
-                acceleration = self._parse_float(segment.get('acceleration', 0))
-                duration = self._parse_float(segment.get('duration', 0))
-                
                 # 세그먼트 시간 정보 계산
                 if frame_start > 0 and frame_end > 0 and fps > 0:
                     segment_duration = (frame_end - frame_start) / fps
                     avg_velocity_ms = avg_velocity / 3.6 if avg_velocity > 0 else 0  # km/h → m/s
-                    
 
-                    
-                    # Video Analysis 데이터 (계단식)
+
+
+                    # Video Analysis 데이터 (계단식) - np 스칼라는 직렬화 전에 float로 변환
                     if avg_velocity > 0:
-                        point1 = {'time': current_time, 'velocity': avg_velocity}
-                        point2 = {'time': current_time + segment_duration, 'velocity': avg_velocity}
+                        point1 = {'time': float(current_time), 'velocity': float(avg_velocity)}
+                        point2 = {'time': float(current_time + segment_duration), 'velocity': float(avg_velocity)}
                         
                         video_analysis_velocity.append(point1)
                         video_analysis_velocity.append(point2)
-                        
 
-                    else:
-                        pass
-                    
                     current_time += segment_duration
             
             # Optimization 데이터 생성 (노드-선형식 알고리즘)
-            optimization_velocity = self._generate_optimization_velocity(segments, fps)
-            
+            optimization_velocity = self._generate_optimization_velocity(segments, fps, snapshot)
+
             # 그래프 데이터 업데이트
             self._project_data['graph_data']['optimization_velocity'] = optimization_velocity
             self._project_data['graph_data']['video_analysis_velocity'] = video_analysis_velocity
-            
+
             # 테이블에서 계산된 값들 업데이트 (duration, avg_velocity 등)
-            self._update_calculated_values()
-            
+            self._update_calculated_values(snapshot)
+
             # 최적화 데이터가 생성되었으므로 가속도 값들 계산
             if optimization_velocity:
-                self._update_table_from_optimization_data()
-            
+                self._update_table_from_optimization_data(snapshot)
 
+            # 캐시 히트 시 파생 컬럼 복원용 참조 (위 두 호출로 채워진 상태)
+            self._enriched_segments = segments
 
-
-            
         except Exception as e:
-            pass
             self.error_occurred.emit(f"그래프 데이터 계산 중 오류: {e}")
-    
-    def _initialize_linear_coefficients(self, segments, fps):
-        """거리 제약 기반 선형 계수 초기화"""
+
+    def _restore_computed_fields(self, segments):
+        """캐시 히트 시 이전에 채운 파생 컬럼을 새 구간 dict로 복사
+
+        테이블 페이로드는 사용자 입력 컬럼만 담고 있어 그대로 두면
+        저장 시 duration/acceleration 등이 빠진 프로젝트 파일이 생성된다.
+        실제 계산도 이 컬럼들을 무조건 덮어쓰므로 (지문이 같아 입력도
+        동일한 상황) 페이로드에 있는 원시 셀 값보다 캐시 값이 우선이다.
+        """
+        cached = self._enriched_segments
+        if cached is None or cached is segments or len(cached) != len(segments):
+            return
+        for new_seg, old_seg in zip(segments, cached):
+            for key in _COMPUTED_SEGMENT_FIELDS:
+                if key in old_seg:
+                    new_seg[key] = old_seg[key]
+        self._enriched_segments = segments
+
+    def _initialize_linear_coefficients(self, snapshot, fps):
+        """거리 제약 기반 선형 계수 초기화 (SoA numpy 배열)"""
         try:
-            coefficients = []
-            
-            for i, segment in enumerate(segments):
-                # 구간 데이터 추출
-                frame_start = self._parse_float(segment.get('frame_start', 0))
-                frame_end = self._parse_float(segment.get('frame_end', 0))
-                distance = self._parse_float(segment.get('distance', 0))
-                
-                if frame_start > 0 and frame_end > 0 and fps > 0 and distance > 0:
-                    # 구간 시간 계산
-                    duration = (frame_end - frame_start) / fps
-                    
-                    # m_i = 2s_i / Δt_i 계산 (거리 제약 상수)
-                    # distance(m) → km/h 변환: m/s * 3.6
-                    m_i = 2 * distance * 3.6 / duration if duration > 0 else 0
-                    
-                    coefficients.append({
-                        'segment_index': i,
-                        'distance_constraint': m_i,  # m_i 상수
-                        'duration': duration,
-                        'distance': distance,
-                        'start_time': 0  # 나중에 계산
-                    })
-                else:
-                    # 유효하지 않은 구간은 기본값
-                    coefficients.append({
-                        'segment_index': i,
-                        'distance_constraint': 0,
-                        'duration': 0,
-                        'distance': 0,
-                        'start_time': 0
-                    })
-            
-            # 시작 시간 계산
-            current_time = 0.0
-            for coeff in coefficients:
-                coeff['start_time'] = current_time
-                current_time += coeff['duration']
-            
-            return coefficients
-            
+            n = snapshot.shape[0]
+            if n == 0:
+                return None
+
+            # 스냅샷 열에서 바로 벡터 연산 (구간별 재파싱 없음)
+            frame_start = snapshot[:, 0]
+            frame_end = snapshot[:, 1]
+            distance = snapshot[:, 2]
+
+            duration_arr = np.zeros(n, dtype=np.float64)
+            distance_arr = np.zeros(n, dtype=np.float64)
+            if fps > 0:
+                valid = (frame_start > 0) & (frame_end > 0) & (distance > 0)
+                duration_arr[valid] = (frame_end[valid] - frame_start[valid]) / fps
+                distance_arr[valid] = distance[valid]
+
+            # m_i = 2s_i / Δt_i 계산 (거리 제약 상수)
+            # distance(m) → km/h 변환: m/s * 3.6
+            m_arr = np.zeros(n, dtype=np.float64)
+            np.divide(2.0 * distance_arr * 3.6, duration_arr,
+                      out=m_arr, where=duration_arr > 0)
+
+            # 시작 시간 계산 (누적 합)
+            start_time_arr = np.concatenate(([0.0], np.cumsum(duration_arr)[:-1]))
+
+            return _Coefficients(m=m_arr, duration=duration_arr,
+                                 distance=distance_arr, start_time=start_time_arr)
+
         except Exception as e:
-            return []
+            return None
     
     def _calculate_linear_coefficients(self, coefficients, anchor_index=0):
         """앵커 기반 A_i, B_i 계수 계산 - 올바른 m-전파식 사용"""
         try:
-            if not coefficients:
-                return []
-            
-            num_segments = len(coefficients)
-            linear_params = [{'A': 0.0, 'B': 0.0} for _ in range(num_segments)]
-            
-            # 1. A 계수 설정 (부호 패턴)
-            for i in range(num_segments):
-                distance_from_anchor = abs(i - anchor_index)
-                if distance_from_anchor % 2 == 0:
-                    linear_params[i]['A'] = 1.0  # 앵커와 같은 방향
-                else:
-                    linear_params[i]['A'] = -1.0  # 앵커와 반대 방향
-            
-            # 2. B 계수 전파식 적용: B[i+1] = m[i] - B[i]
-            # 앵커부터 시작
-            linear_params[anchor_index]['B'] = 0.0
-            
-            # 앵커에서 앞으로 전파 (anchor_index → N-1)
-            for i in range(anchor_index, num_segments - 1):
-                m_i = coefficients[i]['distance_constraint']
-                linear_params[i + 1]['B'] = m_i - linear_params[i]['B']
-            
-            # 앵커에서 뒤로 전파 (anchor_index → 0)
-            for i in range(anchor_index, 0, -1):
-                m_i_minus_1 = coefficients[i - 1]['distance_constraint']
-                linear_params[i - 1]['B'] = m_i_minus_1 - linear_params[i]['B']
-            
-            return linear_params
-            
+            if coefficients is None:
+                return None
+
+            m_arr = coefficients.m
+            num_segments = m_arr.size
+            if num_segments == 0:
+                return None
+
+            # 1. A 계수 설정 (부호 패턴) - 앵커와의 거리 홀짝에 따라 ±1 (분기 없는 패리티 계산)
+            A_arr = 1.0 - 2.0 * ((np.arange(num_segments) - anchor_index) & 1).astype(np.float64)
+
+            # 2. B 계수 전파식의 닫힌 형태: B[i+1] = m[i] - B[i] 점화식을 풀면
+            #    B[anchor+k] = (-1)^(k-1) * Σ_{j<k} (-1)^j · m[anchor+j]
+            #    → 부호 반전된 m의 prefix sum(np.cumsum) 한 번으로 계산 가능
+            B_arr = np.zeros(num_segments, dtype=np.float64)
+
+            # 앵커에서 앞으로 (anchor_index → N-1)
+            fwd = m_arr[anchor_index:num_segments - 1]
+            if fwd.size:
+                sign = (-1.0) ** np.arange(fwd.size)
+                B_arr[anchor_index + 1:] = sign * np.cumsum(sign * fwd)
+
+            # 앵커에서 뒤로 (anchor_index → 0), 아래쪽 m을 역순으로 동일 전개
+            bwd = m_arr[anchor_index - 1::-1] if anchor_index > 0 else m_arr[:0]
+            if bwd.size:
+                sign = (-1.0) ** np.arange(bwd.size)
+                B_arr[:anchor_index] = (sign * np.cumsum(sign * bwd))[::-1]
+
+            return _LinearParams(A=A_arr, B=B_arr)
+
         except Exception as e:
-            return []
+            return None
     
     def _determine_initial_anchor(self, segments):
         """초기 앵커 속도 결정"""
@@ -321,153 +432,161 @@ class DataBridge(QObject):
         except Exception as e:
             return 50.0
     
-    def _generate_optimization_velocity(self, segments, fps):
+    def _generate_optimization_velocity(self, segments, fps, snapshot=None):
         """앵커 기반 노드-선형식 알고리즘: 거리 보존과 연속성 완벽 보장"""
         try:
+            if snapshot is None:
+                snapshot = self._build_segment_snapshot(segments)
+
             # 1. 거리 제약 상수 계산
-            self._linear_coefficients = self._initialize_linear_coefficients(segments, fps)
-            
-            if not self._linear_coefficients:
+            self._linear_coefficients = self._initialize_linear_coefficients(snapshot, fps)
+
+            if self._linear_coefficients is None:
                 return []
-            
+
             # 2. 선형 계수 계산 (앵커는 첫 번째 구간으로 설정)
             self._anchor_index = 0
             self._linear_params = self._calculate_linear_coefficients(
                 self._linear_coefficients, self._anchor_index
             )
-            
+
+            if self._linear_params is None:
+                return []
+
             # 3. 초기 앵커 속도 결정
             if self._current_anchor_velocity is None:
                 self._current_anchor_velocity = self._determine_initial_anchor(segments)
-            
+
+            m_arr = self._linear_coefficients.m
+            duration_arr = self._linear_coefficients.duration
+            start_time_arr = self._linear_coefficients.start_time
+            A_arr = self._linear_params.A
+            B_arr = self._linear_params.B
+
+            # B 계수 전파식 검증 (DEBUG 레벨에서만 수행 - 포맷팅 비용 회피)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("앵커 속도: %.2f km/h", self._current_anchor_velocity)
+
+                logger.debug("=== B 계수 전파식 검증 ===")
+                for i in range(B_arr.size):
+                    logger.debug("B[%d] = %.2f", i, B_arr[i])
+
+                # 전파 관계 검증: B[i] + B[i+1] = m[i]
+                for i in range(m_arr.size - 1):
+                    expected = m_arr[i]
+                    actual = B_arr[i] + B_arr[i + 1]
+                    diff = abs(expected - actual)
+
+                    logger.debug("검증 구간%d: B[%d](%.2f) + B[%d](%.2f) = %.2f vs m[%d] = %.2f, 차이: %.6f",
+                                 i + 1, i, B_arr[i], i + 1, B_arr[i + 1], actual, i, expected, diff)
+                    if diff > 1e-6:
+                        logger.debug("❌ 전파식 오류 발견: 구간%d", i + 1)
+                logger.debug("=== B 계수 검증 완료 ===")
+
             # 4. 앵커 기반으로 모든 포인트 생성
-            optimization_velocity = []
-            
-            print(f"[DataBridge] 앵커 속도: {self._current_anchor_velocity:.2f} km/h")
-            
-            # B 계수 전파식 검증
-            print("[DataBridge] === B 계수 전파식 검증 ===")
-            for i in range(len(self._linear_params)):
-                B_i = self._linear_params[i]['B']
-                print(f"[DataBridge] B[{i}] = {B_i:.2f}")
-            
-            # 전파 관계 검증: B[i] + B[i+1] = m[i]
-            for i in range(len(self._linear_coefficients)-1):
-                B_current = self._linear_params[i]['B']
-                B_next = self._linear_params[i+1]['B']
-                m_i = self._linear_coefficients[i]['distance_constraint']
-                
-                expected = m_i
-                actual = B_current + B_next
-                diff = abs(expected - actual)
-                
-                print(f"[DataBridge] 검증 구간{i+1}: B[{i}]({B_current:.2f}) + B[{i+1}]({B_next:.2f}) = {actual:.2f} vs m[{i}] = {expected:.2f}, 차이: {diff:.6f}")
-                if diff > 1e-6:
-                    print(f"[DataBridge] ❌ 전파식 오류 발견: 구간{i+1}")
-                else:
-                    print(f"[DataBridge] ✅ 전파식 정상: 구간{i+1}")
-            print("[DataBridge] === B 계수 검증 완료 ===")
-            
-            for i, (coeff, param) in enumerate(zip(self._linear_coefficients, self._linear_params)):
-                if coeff['duration'] <= 0:
-                    continue
-                
+            if data_bridge_kernels.NUMBA_AVAILABLE:
+                # Numba 커널: B 전파 + 포인트 생성을 네이티브 코드로 수행
+                times, velocities = data_bridge_kernels.propagate_and_generate(
+                    m_arr, duration_arr, start_time_arr,
+                    self._anchor_index, float(self._current_anchor_velocity)
+                )
+                start_velocity = velocities[0::2]
+                end_velocity = velocities[1::2]
+            else:
                 # 시작 속도: v_i(w) = A_i * w + B_i
-                start_velocity = param['A'] * self._current_anchor_velocity + param['B']
-                
+                start_velocity = A_arr * self._current_anchor_velocity + B_arr
                 # 끝 속도: 거리 제약 적용 v_i+1 = m_i - v_i
-                end_velocity = coeff['distance_constraint'] - start_velocity
-                
-                print(f"[DataBridge] 구간{i+1}: A={param['A']:+.1f}, B={param['B']:+.2f}, m={coeff['distance_constraint']:.2f}")
-                print(f"[DataBridge] 구간{i+1}: 시작={start_velocity:.2f}, 끝={end_velocity:.2f} km/h")
-                
-                # 포인트 생성
-                start_time = coeff['start_time']
-                end_time = start_time + coeff['duration']
-                
-                optimization_velocity.extend([
-                    {'time': start_time, 'velocity': start_velocity},
-                    {'time': end_time, 'velocity': end_velocity}
-                ])
-            
-            # 노드 인덱스 매핑 검사
-            print("[DataBridge] === 노드 인덱스 매핑 검사 ===")
-            for i in range(len(optimization_velocity)):
-                if i % 2 == 0:  # 시작 포인트
-                    segment_num = (i // 2) + 1
-                    print(f"[DataBridge] 노드[{i}] = 구간{segment_num} 시작: {optimization_velocity[i]['velocity']:.2f}")
-                else:  # 끝 포인트
+                end_velocity = m_arr - start_velocity
+
+            if logger.isEnabledFor(logging.DEBUG):
+                for i in range(m_arr.size):
+                    logger.debug("구간%d: A=%+.1f, B=%+.2f, m=%.2f", i + 1, A_arr[i], B_arr[i], m_arr[i])
+                    logger.debug("구간%d: 시작=%.2f, 끝=%.2f km/h", i + 1, start_velocity[i], end_velocity[i])
+
+            # (시작, 끝) 포인트를 시간순으로 인터리빙한 (2n, 2) 배열 구성
+            points = self._fill_anchor_points(start_velocity, end_velocity)
+
+            # 내부 핫패스용 (n, 2) 배열 캐시 - dict 리스트는 방출 경계에서만 생성
+            self._opt_points = points
+
+            # 경계 노드 동일성 검사 (연속성 검증, DEBUG 레벨에서만 수행)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("=== 경계 노드 동일성 검사 ===")
+                for i in range(0, points.shape[0] - 2, 2):
+                    current_end_vel = points[i + 1, 1]
+                    next_start_vel = points[i + 2, 1]
+
                     segment_num = (i // 2) + 1
-                    print(f"[DataBridge] 노드[{i}] = 구간{segment_num} 끝: {optimization_velocity[i]['velocity']:.2f}")
-            
-            # 경계 노드 동일성 검사
-            print("[DataBridge] === 경계 노드 동일성 검사 ===")
-            for i in range(0, len(optimization_velocity)-2, 2):
-                current_end_idx = i + 1
-                next_start_idx = i + 2
-                current_end_vel = optimization_velocity[current_end_idx]['velocity']
-                next_start_vel = optimization_velocity[next_start_idx]['velocity']
-                
-                segment_num = (i // 2) + 1
-                print(f"[DataBridge] 구간{segment_num}→{segment_num+1}: 노드[{current_end_idx}]({current_end_vel:.2f}) vs 노드[{next_start_idx}]({next_start_vel:.2f})")
-                
-                # 같은 노드여야 하는데 다른 값인지 확인
-                if abs(current_end_vel - next_start_vel) > 0.001:
-                    print(f"[DataBridge] ❌ 경계 노드 불일치: 노드[{current_end_idx}] ≠ 노드[{next_start_idx}]")
-                else:
-                    print(f"[DataBridge] ✅ 경계 노드 일치")
-            
-            # 연속성 검증 로그
-            print("[DataBridge] === 연속성 검증 ===")
-            for i in range(0, len(optimization_velocity)-2, 2):
-                current_end = optimization_velocity[i+1]['velocity']
-                next_start = optimization_velocity[i+2]['velocity']
-                diff = abs(current_end - next_start)
-                segment_num = (i // 2) + 1
-                print(f"[DataBridge] 구간{segment_num} 끝({current_end:.2f}) vs 구간{segment_num+1} 시작({next_start:.2f}) 차이: {diff:.2f}")
-                if diff > 0.1:
-                    print(f"[DataBridge] ⚠️ 연속성 문제 발견: 구간{segment_num}→{segment_num+1}")
-            print("[DataBridge] === 검증 완료 ===")
-            
-            return optimization_velocity
-            
+                    diff = abs(current_end_vel - next_start_vel)
+                    logger.debug("구간%d→%d: 끝(%.2f) vs 시작(%.2f) 차이: %.2f",
+                                 segment_num, segment_num + 1, current_end_vel, next_start_vel, diff)
+                    if diff > 0.001:
+                        logger.debug("❌ 경계 노드 불일치: 구간%d→%d", segment_num, segment_num + 1)
+                logger.debug("=== 검증 완료 ===")
+
+            # 방출 경계에서만 dict 리스트 API 유지
+            return [{'time': float(t), 'velocity': float(v)} for t, v in points]
+
         except Exception as e:
-            pass
             return []
     
+    def _fill_anchor_points(self, start_velocity, end_velocity):
+        """(시작, 끝) 속도 배열을 인터리빙해 (2n, 2) 포인트 배열로 구성
+
+        앵커 드래그는 마우스 이동 빈도로 호출되므로 재사용 버퍼에
+        제자리 기록해 호출당 할당을 없앤다. 모든 구간이 유효하면
+        버퍼 자체를 반환하고, 아니면 유효 구간만 추려 반환한다.
+        """
+        coeffs = self._linear_coefficients
+        n = coeffs.m.size
+
+        scratch = self._anchor_scratch
+        if scratch is None or scratch.shape[0] != 2 * n:
+            scratch = self._anchor_scratch = np.empty((2 * n, 2), dtype=np.float64)
+
+        scratch[0::2, 0] = coeffs.start_time
+        np.add(coeffs.start_time, coeffs.duration, out=scratch[1::2, 0])
+        scratch[0::2, 1] = start_velocity
+        scratch[1::2, 1] = end_velocity
+
+        # 유효하지 않은 구간(duration <= 0)의 포인트 제외
+        valid = coeffs.duration > 0
+        if valid.all():
+            return scratch
+        return scratch[np.repeat(valid, 2)]
+
     def _update_from_anchor_change(self, new_anchor_velocity):
         """앵커 변경 시 전체 그래프 업데이트"""
         try:
-            if not self._linear_coefficients or not self._linear_params:
+            if self._linear_coefficients is None or self._linear_params is None:
                 return []
-            
+
             # 앵커 속도 업데이트
             self._current_anchor_velocity = new_anchor_velocity
-            
+
             # 앵커 기반으로 모든 포인트 재계산
-            optimization_velocity = []
-            
-            for i, (coeff, param) in enumerate(zip(self._linear_coefficients, self._linear_params)):
-                if coeff['duration'] <= 0:
-                    continue
-                
+            m_arr = self._linear_coefficients.m
+            duration_arr = self._linear_coefficients.duration
+            start_time_arr = self._linear_coefficients.start_time
+
+            if data_bridge_kernels.NUMBA_AVAILABLE:
+                times, velocities = data_bridge_kernels.propagate_and_generate(
+                    m_arr, duration_arr, start_time_arr,
+                    self._anchor_index, float(self._current_anchor_velocity)
+                )
+                start_velocity = velocities[0::2]
+                end_velocity = velocities[1::2]
+            else:
                 # 시작 속도: v_i(w) = A_i * w + B_i
-                start_velocity = param['A'] * self._current_anchor_velocity + param['B']
-                
+                start_velocity = self._linear_params.A * self._current_anchor_velocity + self._linear_params.B
                 # 끝 속도: 거리 제약 적용
-                end_velocity = coeff['distance_constraint'] - start_velocity
-                
-                # 포인트 생성
-                start_time = coeff['start_time']
-                end_time = start_time + coeff['duration']
-                
-                optimization_velocity.extend([
-                    {'time': start_time, 'velocity': start_velocity},
-                    {'time': end_time, 'velocity': end_velocity}
-                ])
-            
-            return optimization_velocity
-            
+                end_velocity = m_arr - start_velocity
+
+            points = self._fill_anchor_points(start_velocity, end_velocity)
+            self._opt_points = points
+
+            return [{'time': float(t), 'velocity': float(v)} for t, v in points]
+
         except Exception as e:
             return []
     
@@ -478,52 +597,73 @@ class DataBridge(QObject):
             segment_index = point_index // 2  # 각 구간마다 2개 포인트
             
             # 수정된 가드 조건: segment_index 기준으로 검사
-            if not self._linear_params or not self._linear_coefficients or segment_index >= len(self._linear_params):
+            if (self._linear_params is None or self._linear_coefficients is None or
+                    segment_index >= self._linear_params.A.size):
                 return target_velocity
-            
-            param = self._linear_params[segment_index]
-            
+
+            A_i = self._linear_params.A[segment_index]
+            B_i = self._linear_params.B[segment_index]
+
             # 끝점(odd index) 처리: 시작값으로 환산 후 역계산
             if point_index % 2 == 1:  # 끝점인 경우
-                if segment_index < len(self._linear_coefficients):
-                    m_i = self._linear_coefficients[segment_index]['distance_constraint']
-                    # v_i_equiv = m_i - v_{i+1} (끝점을 시작값으로 환산)
-                    v_equiv = m_i - target_velocity
-                else:
-                    v_equiv = target_velocity
+                m_i = self._linear_coefficients.m[segment_index]
+                # v_i_equiv = m_i - v_{i+1} (끝점을 시작값으로 환산)
+                v_equiv = m_i - target_velocity
             else:  # 시작점인 경우
                 v_equiv = target_velocity
-            
+
             # v_i(w) = A_i * w + B_i에서 w 역계산
             # w = (v_i_equiv - B_i) / A_i
-            if abs(param['A']) > 0.001:  # 0으로 나누기 방지
-                anchor_velocity = (v_equiv - param['B']) / param['A']
+            if abs(A_i) > 0.001:  # 0으로 나누기 방지
+                anchor_velocity = (v_equiv - B_i) / A_i
                 return anchor_velocity
-            
+
             return target_velocity
             
         except Exception as e:
             return target_velocity
     
+    def _classify_acc_dec(self, acceleration, max_acc, max_dec,
+                          uniform_threshold=DEFAULT_UNIFORM_MOTION_THRESHOLD) -> str:
+        """가속도 값을 등속/가속/감속 유형 문자열로 분류"""
+        if abs(acceleration) <= uniform_threshold:
+            # 등속 구간 (임계값 이하)
+            return "Const (Uniform)"
+        if acceleration > uniform_threshold:
+            # 가속 구간
+            return "Acc (Valid)" if acceleration <= max_acc else "Acc (Invalid)"
+        # 감속 구간
+        return "Dec (Valid)" if acceleration >= max_dec else "Dec (Invalid)"
+
     def _parse_float(self, value, default=0.0):
         """문자열을 float로 안전하게 변환"""
+        # 가장 흔한 타입부터 정확한 타입 검사로 조기 반환
+        if type(value) is float:
+            return value
+        if type(value) is int:
+            return float(value)
+        if type(value) is str:
+            parsed = _parse_float_str(value)
+            return parsed if parsed is not None else default
         try:
             if isinstance(value, (int, float)):
                 return float(value)
-            elif isinstance(value, str) and value.strip():
-                return float(value.strip())
             return default
         except (ValueError, TypeError):
             return default
     
-    def _update_calculated_values(self):
+    def _update_calculated_values(self, snapshot=None):
         """테이블의 계산된 값들 업데이트"""
         try:
             fps = self._project_data['settings']['fps']
             max_acc = self._project_data['settings']['max_acceleration']
             max_dec = self._project_data['settings']['max_deceleration']
-            
-            for segment in self._project_data['segments']:
+
+            segments = self._project_data['segments']
+            if snapshot is None:
+                snapshot = self._build_segment_snapshot(segments)
+
+            for i, segment in enumerate(segments):
                 # 7-10열 계산 값 초기화 (테이블에서 전송되지 않으므로 기본값 설정)
                 if 'acc_velocity' not in segment:
                     segment['acc_velocity'] = 0.0
@@ -534,139 +674,106 @@ class DataBridge(QObject):
                 if 'acc_dec_type' not in segment:
                     segment['acc_dec_type'] = ""
                 
-                # 프레임 정보가 있는 경우 duration 계산
-                frame_start = self._parse_float(segment.get('frame_start', 0))
-                frame_end = self._parse_float(segment.get('frame_end', 0))
-                distance = self._parse_float(segment.get('distance', 0))
-                
+                # 프레임 정보가 있는 경우 duration 계산 (스냅샷 재사용)
+                frame_start = snapshot[i, 0]
+                frame_end = snapshot[i, 1]
+                distance = snapshot[i, 2]
+
                 if frame_start > 0 and frame_end > 0 and fps > 0:
-                    duration = (frame_end - frame_start) / fps
+                    duration = float((frame_end - frame_start) / fps)
                     segment['duration'] = round(duration, 3)
-                    
+
                     # 평균 속도 계산 (거리와 시간이 있는 경우)
                     if distance > 0 and duration > 0:
-                        avg_velocity_ms = distance / duration  # m/s
+                        avg_velocity_ms = float(distance) / duration  # m/s
                         avg_velocity_kmh = avg_velocity_ms * 3.6  # km/h
                         segment['avg_velocity'] = round(avg_velocity_kmh, 2)
                         segment['avg_time'] = round(duration, 3)
                 
                 # 가속도 검증 (기본값 0 사용)
                 acceleration = self._parse_float(segment.get('acceleration', 0))
-                uniform_threshold = DEFAULT_UNIFORM_MOTION_THRESHOLD
-                
-                acc_dec_type = ""
-                if abs(acceleration) <= uniform_threshold:
-                    # 등속 구간 (임계값 이하)
-                    acc_dec_type = "Const (Uniform)"
-                elif acceleration > uniform_threshold:
-                    # 가속 구간
-                    if acceleration <= max_acc:
-                        acc_dec_type = "Acc (Valid)"
-                    else:
-                        acc_dec_type = "Acc (Invalid)"
-                else:  # acceleration < -uniform_threshold
-                    # 감속 구간
-                    if acceleration >= max_dec:
-                        acc_dec_type = "Dec (Valid)"
-                    else:
-                        acc_dec_type = "Dec (Invalid)"
-                
-                segment['acc_dec_type'] = acc_dec_type
+                segment['acc_dec_type'] = self._classify_acc_dec(acceleration, max_acc, max_dec)
                 
 
             
         except Exception as e:
             pass
     
-    def _update_table_from_optimization_data(self):
+    def _update_table_from_optimization_data(self, snapshot=None):
         """최적화된 그래프 데이터를 기반으로 테이블 업데이트"""
         try:
-            optimization_data = self._project_data['graph_data'].get('optimization_velocity', [])
-            if not optimization_data:
+            # 핫패스는 (n, 2) 배열 캐시 사용 - 없으면 dict 리스트에서 재구성
+            opt_arr = self._opt_points
+            if opt_arr is None:
+                optimization_data = self._project_data['graph_data'].get('optimization_velocity', [])
+                opt_arr = np.array(
+                    [[p['time'], p['velocity']] for p in optimization_data],
+                    dtype=np.float64
+                ).reshape(-1, 2)
+            if opt_arr.shape[0] == 0:
                 return
-            
+
             fps = self._project_data['settings']['fps']
             segments = self._project_data['segments']
-            
+            if snapshot is None:
+                snapshot = self._build_segment_snapshot(segments)
+
+            # 구간별 지속시간/시작시간을 한 번에 사전 계산 (O(n²) 중첩 합산 제거)
+            frame_starts = snapshot[:, 0]
+            frame_ends = snapshot[:, 1]
+            durations = np.zeros(snapshot.shape[0], dtype=np.float64)
+            if fps > 0:
+                valid = (frame_starts > 0) & (frame_ends > 0)
+                durations[valid] = (frame_ends[valid] - frame_starts[valid]) / fps
+            starts = np.concatenate(([0.0], np.cumsum(durations)[:-1]))
+
+            # 최적화 포인트 시간축은 단조 증가 - 구간별 이진 탐색용 열 뷰
+            times_arr = opt_arr[:, 0]
+            vels_arr = opt_arr[:, 1]
+
             # 각 구간별로 최적화 데이터 분석
             for i, segment in enumerate(segments):
-                frame_start = self._parse_float(segment.get('frame_start', 0))
-                frame_end = self._parse_float(segment.get('frame_end', 0))
-                
-                if frame_start == 0 or frame_end == 0 or fps == 0:
+                if frame_starts[i] == 0 or frame_ends[i] == 0 or fps == 0:
                     continue
-                
+
                 # 구간 시간 범위 계산
-                segment_start_time = 0.0
-                if i > 0:
-                    # 이전 구간들의 시간 합산
-                    for j in range(i):
-                        prev_start = self._parse_float(segments[j].get('frame_start', 0))
-                        prev_end = self._parse_float(segments[j].get('frame_end', 0))
-                        if prev_start > 0 and prev_end > 0:
-                            segment_start_time += (prev_end - prev_start) / fps
+                segment_start_time = starts[i]
+                segment_end_time = starts[i] + durations[i]
                 
-                segment_end_time = segment_start_time + (frame_end - frame_start) / fps
-                
-                # 해당 구간의 최적화 데이터 찾기
-                segment_opt_data = []
-                for point in optimization_data:
-                    if segment_start_time <= point['time'] <= segment_end_time:
-                        segment_opt_data.append(point)
-                
-                if len(segment_opt_data) >= 2:
-                    # 가속도 구간 분석
-                    first_point = segment_opt_data[0]
-                    last_point = segment_opt_data[-1]
-                    
-                    # 초기 속도와 최종 속도
-                    initial_velocity = first_point['velocity']
-                    final_velocity = last_point['velocity']
-                    
+                # 해당 구간의 최적화 데이터 찾기 (이진 탐색으로 범위 슬라이스)
+                lo = np.searchsorted(times_arr, segment_start_time, 'left')
+                hi = np.searchsorted(times_arr, segment_end_time, 'right')
+
+                if hi - lo >= 2:
+                    # 가속도 구간 분석: 초기 속도와 최종 속도
+                    initial_velocity = vels_arr[lo]
+                    final_velocity = vels_arr[hi - 1]
+
                     # 가속도가 있는 경우
                     vel_diff = abs(final_velocity - initial_velocity)
-                    
+
                     if vel_diff > 0.1:  # 0.1 km/h 임계값
                         # 가속도 계산
-                        time_diff = last_point['time'] - first_point['time']
+                        time_diff = times_arr[hi - 1] - times_arr[lo]
                         if time_diff > 0:
                             vel_diff_ms = (final_velocity - initial_velocity) / 3.6  # km/h to m/s
-                            acceleration = vel_diff_ms / time_diff
-                            
-                            # 테이블 업데이트
+                            acceleration = float(vel_diff_ms / time_diff)
+
+                            # 테이블 업데이트 (np 스칼라는 직렬화 전에 float로 변환)
                             segment['acceleration'] = round(acceleration, 2)
-                            segment['acc_time'] = round(time_diff, 3)
-                            segment['acc_velocity'] = round(final_velocity, 2)
-                            
+                            segment['acc_time'] = round(float(time_diff), 3)
+                            segment['acc_velocity'] = round(float(final_velocity), 2)
+
                             # 가속도 유효성 검증
                             max_acc = self._project_data['settings']['max_acceleration']
                             max_dec = self._project_data['settings']['max_deceleration']
-                            uniform_threshold = DEFAULT_UNIFORM_MOTION_THRESHOLD
-                            
-                            if abs(acceleration) <= uniform_threshold:
-                                # 등속 구간
-                                segment['acc_dec_type'] = "Const (Uniform)"
-                            elif acceleration > uniform_threshold:
-                                # 가속 구간
-                                if acceleration <= max_acc:
-                                    segment['acc_dec_type'] = "Acc (Valid)"
-                                else:
-                                    segment['acc_dec_type'] = "Acc (Invalid)"
-                            else:  # acceleration < -uniform_threshold
-                                # 감속 구간
-                                if acceleration >= max_dec:
-                                    segment['acc_dec_type'] = "Dec (Valid)"
-                                else:
-                                    segment['acc_dec_type'] = "Dec (Invalid)"
+                            segment['acc_dec_type'] = self._classify_acc_dec(acceleration, max_acc, max_dec)
                     else:
                         # 일정 속도 유지 (등속구간)
-                        time_diff = last_point['time'] - first_point['time']
+                        time_diff = times_arr[hi - 1] - times_arr[lo]
                         segment['acceleration'] = 0.0
-                        segment['acc_time'] = round(time_diff, 3)  # 실제 구간 지속시간
-                        segment['acc_velocity'] = round(initial_velocity, 2)
-                        
-                        # 등속구간 유효성 검증
-                        uniform_threshold = DEFAULT_UNIFORM_MOTION_THRESHOLD
+                        segment['acc_time'] = round(float(time_diff), 3)  # 실제 구간 지속시간
+                        segment['acc_velocity'] = round(float(initial_velocity), 2)
                         segment['acc_dec_type'] = "Const (Uniform)"
         except Exception as e:
             pass
@@ -676,68 +783,77 @@ class DataBridge(QObject):
     def load_ground_truth_csv(self, filepath: str) -> bool:
         """Ground Truth CSV 파일 로드"""
         try:
-            import pandas as pd
-            
-            # CSV 파일 읽기
-            df = pd.read_csv(filepath)
-            
-            # 데이터 검증
-            if not self._validate_ground_truth_data(df):
-                return False
-            
-            # 데이터 저장
-            ground_truth_data = []
-            for _, row in df.iterrows():
-                ground_truth_data.append({
-                    'time': float(row.iloc[0]),
-                    'velocity': float(row.iloc[1])
-                })
-            
+            # CSV 파일 읽기 (pyarrow 우선, 미설치 시 pandas)
+            if pacsv is not None:
+                tbl = pacsv.read_csv(filepath)
+                if tbl.num_columns < 2:
+                    self.error_occurred.emit("CSV 파일에는 최소 2개의 열(시간, 속도)이 필요합니다.")
+                    return False
+                try:
+                    times = tbl.column(0).to_numpy(zero_copy_only=False).astype(np.float64)
+                    vels = tbl.column(1).to_numpy(zero_copy_only=False).astype(np.float64)
+                except (ValueError, TypeError):
+                    self.error_occurred.emit("CSV 파일의 시간과 속도 데이터는 숫자여야 합니다.")
+                    return False
+                arr = np.column_stack((times, vels))
+            else:
+                import pandas as pd
+
+                df = pd.read_csv(filepath)
+
+                # 데이터 검증 (검증 과정에서 변환된 배열을 그대로 재사용)
+                arr = self._validate_ground_truth_data(df)
+                if arr is None:
+                    return False
+
+            ground_truth_data = [
+                {'time': float(t), 'velocity': float(v)} for t, v in arr
+            ]
+
             self._project_data['graph_data']['ground_truth_velocity'] = ground_truth_data
             self._project_data['ground_truth_file'] = filepath
             
             # 그래프 업데이트 알림
-            self.graph_data_updated.emit(self._project_data['graph_data'])
+            self._schedule_graph_emit()
             
 
             return True
             
         except Exception as e:
-            pass
             self.error_occurred.emit(f"Ground Truth 파일 로드 중 오류: {e}")
             return False
     
-    def _validate_ground_truth_data(self, df) -> bool:
-        """Ground Truth 데이터 검증"""
+    def _validate_ground_truth_data(self, df) -> Optional[np.ndarray]:
+        """Ground Truth 데이터 검증 - 변환된 (시간, 속도) 배열 반환 (실패 시 None)"""
         # 최소 2개 열 확인
         if len(df.columns) < 2:
             self.error_occurred.emit("CSV 파일에는 최소 2개의 열(시간, 속도)이 필요합니다.")
-            return False
-        
-        # 숫자 데이터 확인
+            return None
+
+        # 숫자 데이터 확인 겸 일괄 변환 (검증용 변환 결과를 로드 경로에서 재사용)
         try:
-            pd.to_numeric(df.iloc[:, 0])  # 시간
-            pd.to_numeric(df.iloc[:, 1])  # 속도
+            return np.ascontiguousarray(df.iloc[:, :2].to_numpy(dtype=np.float64))
         except:
             self.error_occurred.emit("CSV 파일의 시간과 속도 데이터는 숫자여야 합니다.")
-            return False
-        
-        return True
+            return None
     
     # === 파일 I/O ===
     
     def save_project(self, filepath: str) -> bool:
         """프로젝트 저장"""
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(self._project_data, f, ensure_ascii=False, indent=2)
-            
+            if orjson is not None:
+                with open(filepath, 'wb') as f:
+                    f.write(orjson.dumps(self._project_data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(filepath, 'w', encoding='utf-8') as f:
+                    json.dump(self._project_data, f, ensure_ascii=False, indent=2)
+
             self._unsaved_changes = False
 
             return True
             
         except Exception as e:
-            pass
             self.error_occurred.emit(f"프로젝트 저장 중 오륙: {e}")
             return False
     
@@ -754,7 +870,10 @@ class DataBridge(QObject):
             self._linear_coefficients = None
             self._linear_params = None
             self._current_anchor_velocity = None
-            
+            self._opt_points = None
+            self._graph_cache_key = None
+            self._enriched_segments = None
+
             # 모든 윈도우에 업데이트 알림
             self.table_data_updated.emit({'segments': self._project_data['segments']})
             
@@ -765,7 +884,6 @@ class DataBridge(QObject):
             return True
             
         except Exception as e:
-            pass
             self.error_occurred.emit(f"프로젝트 로드 중 오류: {e}")
             return False
     
@@ -801,6 +919,9 @@ class DataBridge(QObject):
         """설정 업데이트"""
         self._project_data['settings'].update(settings)
         self._unsaved_changes = True
+        # 가감속 제한이 바뀌면 acc_dec_type 분류가 달라지므로 메모 무효화
+        self._graph_cache_key = None
+        self.settings_changed.emit(self.get_settings())
 
     
     def cleanup(self):
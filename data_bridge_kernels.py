@@ -0,0 +1,59 @@
+"""
+DataBridgeKernels - 수치 커널 모듈
+앵커 기반 노드-선형식 계산의 핫패스 (Numba 설치 시 네이티브 컴파일)
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Numba 미설치 시 데코레이터 무시 (순수 Python 경로)"""
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrapper(func):
+            return func
+        return wrapper
+
+
+@njit(cache=True)
+def propagate_and_generate(m, duration, start_time, anchor_index, w):
+    """B 계수 전파 및 (시간, 속도) 포인트 배열 생성
+
+    B[i+1] = m[i] - B[i] 전파식과 v_i = A_i·w + B_i, v_end = m_i - v_i 를
+    한 커널에서 수행하고 구간당 (시작, 끝) 포인트를 인터리빙해 반환한다.
+
+    Returns:
+        (times, velocities): 각각 길이 2n의 float64 배열
+    """
+    n = m.shape[0]
+
+    # B 계수 전파 (앵커 기준 앞/뒤 방향)
+    B = np.zeros(n, dtype=np.float64)
+    for i in range(anchor_index, n - 1):
+        B[i + 1] = m[i] - B[i]
+    for i in range(anchor_index, 0, -1):
+        B[i - 1] = m[i - 1] - B[i]
+
+    times = np.empty(2 * n, dtype=np.float64)
+    velocities = np.empty(2 * n, dtype=np.float64)
+    for i in range(n):
+        # A_i: 앵커와의 거리 홀짝에 따라 ±1
+        sign = 1.0 if (i - anchor_index) % 2 == 0 else -1.0
+        start_v = sign * w + B[i]
+        times[2 * i] = start_time[i]
+        times[2 * i + 1] = start_time[i] + duration[i]
+        velocities[2 * i] = start_v
+        velocities[2 * i + 1] = m[i] - start_v
+    return times, velocities
+
+
+if NUMBA_AVAILABLE:
+    # 임포트 시점에 한 번 컴파일해 첫 호출 지연 제거 (cache=True로 재기동 시 AOT 재사용)
+    _warm = np.zeros(1, dtype=np.float64)
+    propagate_and_generate(_warm, _warm, _warm, 0, 0.0)
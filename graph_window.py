@@ -3,17 +3,21 @@ GraphWindow - 그래프 윈도우
 데이터 시각화 및 인터랙티브 조작
 """
 
+import io
+
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
     QFileDialog, QMessageBox
 )
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import QObject, QRunnable, Qt, QThreadPool, QTimer, pyqtSignal
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba
 from matplotlib.figure import Figure
 from matplotlib.ticker import MultipleLocator
-import matplotlib.pyplot as plt
-import seaborn as sns
+import matplotlib as mpl
+import numpy as np
 
 from utils.constants import (
     DEFAULT_GRAPH_WIDTH, DEFAULT_GRAPH_HEIGHT,
@@ -22,6 +26,43 @@ from utils.constants import (
     GRAPH_DPI, POINT_SIZE, LINE_WIDTH,
     DEFAULT_MAX_ACCELERATION, DEFAULT_MAX_DECELERATION
 )
+import graph_window_kernels
+
+# LineCollection 색상 배열용 RGBA 사전 변환 (프레임마다 색상 파싱 방지)
+_VALID_RGBA = to_rgba(ACCELERATION_VALID_COLOR)
+_INVALID_RGBA = to_rgba(ACCELERATION_INVALID_COLOR)
+_OPTIMIZATION_RGBA = to_rgba(OPTIMIZATION_VELOCITY_COLOR)
+
+# 분류 코드(0=허용, 1=초과, 2=dt<=0) → RGBA 룩업 테이블
+_SEG_COLOR_LUT = np.array([_VALID_RGBA, _INVALID_RGBA, _OPTIMIZATION_RGBA])
+
+# 이 포인트 수를 넘으면 채운 마커로 전환 (open 마커는 외곽선을 개별 스트로크)
+_FILLED_MARKER_THRESHOLD = 500
+
+class _SaveSignals(QObject):
+    """백그라운드 저장 작업 완료 시그널 (성공 여부, 경로 또는 오류 메시지)"""
+    finished = pyqtSignal(bool, str)
+
+class _SaveTask(QRunnable):
+    """렌더링된 이미지 바이트를 워커 스레드에서 파일로 기록
+
+    Figure는 스레드 안전하지 않으므로 렌더링(savefig → BytesIO)은
+    메인 스레드에서 끝내고, 디스크 쓰기만 이 작업으로 넘긴다.
+    """
+
+    def __init__(self, file_path, payload):
+        super().__init__()
+        self.file_path = file_path
+        self.payload = payload
+        self.signals = _SaveSignals()
+
+    def run(self):
+        try:
+            with open(self.file_path, 'wb') as f:
+                f.write(self.payload)
+            self.signals.finished.emit(True, self.file_path)
+        except Exception as e:
+            self.signals.finished.emit(False, str(e))
 
 class GraphWindow(QMainWindow):
     """그래프 윈도우 클래스"""
@@ -38,7 +79,26 @@ class GraphWindow(QMainWindow):
         self.optimization_data = []
         self.video_analysis_data = []
         self.ground_truth_data = []
-        
+
+        # 시리즈별 SoA 캐시 (히트 테스트/redraw 등 벡터 연산용 병렬 배열)
+        self._opt_t = None
+        self._opt_v = None
+        self._va_t = None
+        self._va_v = None
+        self._gt_t = None
+        self._gt_v = None
+
+        # 시간축 차분 캐시 (드래그 중 시간은 불변이므로 데이터 갱신 시 한 번만 계산)
+        self._dt = None
+
+        # 축 범위 조정용 시리즈별 범위 캐시 (t_min, t_max, v_min, v_max)
+        self._extents = {'opt': None, 'va': None, 'gt': None}
+
+        # 가속도 제한 설정 캐시 (드래그 프레임마다 get_settings() 호출 방지)
+        settings = data_bridge.get_settings() if data_bridge else {}
+        self._max_acc = float(settings.get('max_acceleration', DEFAULT_MAX_ACCELERATION))
+        self._max_dec = float(settings.get('max_deceleration', DEFAULT_MAX_DECELERATION))
+
         # 인터랙션 상태
         self.dragging = False
         self.selected_point_index = None
@@ -46,6 +106,23 @@ class GraphWindow(QMainWindow):
         
         # 속도 라벨 저장
         self.velocity_labels = []
+
+        # 최적화 구간 선분 컬렉션 (재생성 대신 set_segments/set_color로 갱신)
+        self._seg_lc = None
+
+        # 블리팅용 배경 캐시 (드래그 시작 시 캡처, 데이터 변경 시 무효화)
+        self._bg = None
+
+        # 히트 테스트용 픽셀 좌표 캐시 (draw/데이터 변경 시 무효화 후 지연 재계산)
+        self._opt_disp = None
+
+        # 드래그 redraw 병합 타이머 (~60Hz) - 마우스 이벤트 폭주 시 최신 좌표만 반영
+        self._pending_y = None
+        self._last_motion_y = None  # 직전 이동 좌표 (동일 좌표 이벤트 조기 차단)
+        self._redraw_timer = QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.setInterval(16)
+        self._redraw_timer.timeout.connect(self._apply_pending_drag)
         
         # UI 초기화
         self._setup_ui()
@@ -63,7 +140,8 @@ class GraphWindow(QMainWindow):
         main_layout = QVBoxLayout(central_widget)
         
         # 그래프 캔버스 먼저 생성
-        self.figure = Figure(figsize=(10, 6), dpi=GRAPH_DPI)
+        # constrained_layout: 저장 시 bbox_inches='tight'의 이중 렌더링 불필요
+        self.figure = Figure(figsize=(10, 6), dpi=GRAPH_DPI, constrained_layout=True)
         self.canvas = FigureCanvas(self.figure)
         self.ax = self.figure.add_subplot(111)
         
@@ -101,8 +179,18 @@ class GraphWindow(QMainWindow):
     
     def _setup_graph(self):
         """그래프 초기 설정"""
-        # Seaborn 스타일 적용
-        sns.set_theme(style="darkgrid")
+        # darkgrid 스타일을 이 축에만 적용 (전역 테마 변경 없이 임베딩 유지)
+        self.ax.set_facecolor('#EAEAF2')
+        self.ax.grid(True, color='white', linewidth=1)
+        self.ax.set_axisbelow(True)
+        for spine in self.ax.spines.values():
+            spine.set_visible(False)
+        self.ax.tick_params(length=0)
+
+        # 긴 폴리라인 렌더링 설정: 시각적으로 중복된 정점은 래스터라이저 전에 정리
+        mpl.rcParams['path.simplify'] = True
+        mpl.rcParams['path.simplify_threshold'] = 1.0
+        mpl.rcParams['agg.path.chunksize'] = 10000
         
         # 그래프 제목 및 레이블
         self.ax.set_title('Interactive Velocity Graph Optimizer', 
@@ -112,17 +200,51 @@ class GraphWindow(QMainWindow):
         
         # Y축 초기 범위 설정 (데이터 로드 후 자동 조정됨)
         self.ax.set_ylim(0, 75)
-        self.ax.yaxis.set_major_locator(plt.MultipleLocator(5))
+        self.ax.yaxis.set_major_locator(MultipleLocator(5))
         
         # 범례 설정
-        self.ax.plot([], [], color=ACCELERATION_VALID_COLOR, 
+        self.ax.plot([], [], color=ACCELERATION_VALID_COLOR,
                     label='Acceptable acc/dec range', linewidth=LINE_WIDTH)
-        self.ax.plot([], [], color=ACCELERATION_INVALID_COLOR, 
+        self.ax.plot([], [], color=ACCELERATION_INVALID_COLOR,
                     label='Unacceptable acc/dec range', linewidth=LINE_WIDTH)
+
+        # 최적화 포인트/선택 마커는 영속 아티스트로 생성 (드래그 블리팅 대상)
+        self._opt_line, = self.ax.plot(
+            [], [], color=OPTIMIZATION_VELOCITY_COLOR,
+            marker='o', markersize=POINT_SIZE,
+            linewidth=0,
+            markerfacecolor='none',
+            markeredgecolor=OPTIMIZATION_VELOCITY_COLOR,
+            label='Optimization Velocity'
+        )
+        self._opt_markers_filled = False
+        self._sel_marker, = self.ax.plot(
+            [], [], 'ro', markersize=POINT_SIZE * 1.5, zorder=10,
+            label='_selected_point'
+        )
+        self._va_step, = self.ax.step(
+            [], [], color=VIDEO_ANALYSIS_VELOCITY_COLOR,
+            label='Video Analysis Velocity',
+            marker='s', markersize=POINT_SIZE,
+            linewidth=LINE_WIDTH, fillstyle='none',
+            where='post'
+        )
+        self._gt_line, = self.ax.plot(
+            [], [], color=GROUND_TRUTH_VELOCITY_COLOR,
+            label='Ground Truth Velocity',
+            linestyle='--', linewidth=LINE_WIDTH
+        )
+
+        # 대용량 라인은 래스터 캐시 사용 (벡터 출력 시 일시 해제 - _save_as_svg 참고)
+        self._opt_line.set_rasterized(True)
+        self._va_step.set_rasterized(True)
+        self._gt_line.set_rasterized(True)
+
+        # 범례는 라벨이 고정이므로 여기서 한 번만 구성 (프레임별 재배치 방지)
         self.ax.legend()
         
-        # 초기 그래프 그리기
-        self.canvas.draw()
+        # 초기 그래프 그리기 (이벤트 루프가 한가할 때 수행)
+        self.canvas.draw_idle()
     
     def _connect_signals(self):
         """시그널 연결"""
@@ -130,14 +252,32 @@ class GraphWindow(QMainWindow):
         self.canvas.mpl_connect('button_press_event', self._on_mouse_press)
         self.canvas.mpl_connect('button_release_event', self._on_mouse_release)
         self.canvas.mpl_connect('motion_notify_event', self._on_mouse_motion)
+        self.canvas.mpl_connect('draw_event', self._on_canvas_draw)
+        self.ax.callbacks.connect('xlim_changed', self._on_xlim_changed)
         
         # Data Bridge 시그널 연결
         if self.data_bridge:
             self.data_bridge.graph_data_updated.connect(self._on_data_updated)
+            self.data_bridge.settings_changed.connect(self._on_settings_changed)
             self.data_bridge.error_occurred.connect(self._show_error_message)
     
     # === 그래프 업데이트 메서드 ===
     
+    @staticmethod
+    def _to_soa(points):
+        """리스트-of-dict 포인트를 (시간, 속도) 병렬 배열로 변환"""
+        n = len(points)
+        times = np.fromiter((p['time'] for p in points), dtype=np.float64, count=n)
+        velocities = np.fromiter((p['velocity'] for p in points), dtype=np.float64, count=n)
+        return times, velocities
+
+    def _sync_back_to_dicts(self):
+        """SoA 캐시를 리스트-of-dict API로 역변환 (방출 경계에서만 호출)"""
+        self.optimization_data = [
+            {'time': float(t), 'velocity': float(v)}
+            for t, v in zip(self._opt_t, self._opt_v)
+        ]
+
     def _on_data_updated(self, graph_data):
         """데이터 업데이트 처리"""
         try:
@@ -146,18 +286,50 @@ class GraphWindow(QMainWindow):
             self.optimization_data = graph_data.get('optimization_velocity', [])
             self.video_analysis_data = graph_data.get('video_analysis_velocity', [])
             self.ground_truth_data = graph_data.get('ground_truth_velocity', [])
+
+            # SoA 캐시 재구성 - 브리지가 배열을 함께 보내면 dict 순회 생략
+            # (방출 측 캐시와 공유되므로 드래그 제자리 수정을 위해 복사)
+            opt_t = graph_data.get('opt_t')
+            if opt_t is not None:
+                self._opt_t = np.array(opt_t, dtype=np.float64)
+                self._opt_v = np.array(graph_data['opt_v'], dtype=np.float64)
+            else:
+                self._opt_t, self._opt_v = self._to_soa(self.optimization_data)
+            self._va_t, self._va_v = self._to_soa(self.video_analysis_data)
+            self._gt_t, self._gt_v = self._to_soa(self.ground_truth_data)
+
+            # 검증/분류가 공유하는 시간축 차분 캐시
+            self._dt = np.diff(self._opt_t)
+
+            # 축 범위 조정용 시리즈별 범위 캐시 - 바뀐 시점에 한 번만 축약
+            self._extents['opt'] = self._series_extent(self._opt_t, self._opt_v)
+            self._extents['va'] = self._series_extent(self._va_t, self._va_v)
+            self._extents['gt'] = self._series_extent(self._gt_t, self._gt_v)
             
             # 데이터 변경 시 드래그 상태 초기화 (인덱스 오류 방지)
             if self.dragging:
                 self.dragging = False
                 self.selected_point_index = None
-            
+                self._redraw_timer.stop()
+                self._pending_y = None
+                self._end_drag_blit()
+
+            # 드래그 외 데이터 변경이므로 캡처해둔 배경/픽셀 좌표 캐시 무효화
+            self._bg = None
+            self._opt_disp = None
+
             # 그래프 다시 그리기
             self._update_graph()
             
         except Exception as e:
             self._show_error_message("그래프 업데이트 오류", f"그래프 업데이트 중 오류: {e}")
-    
+
+    def _on_settings_changed(self, settings):
+        """설정 변경 시 가속도 제한 캐시 갱신 후 구간 색상 재분류"""
+        self._max_acc = float(settings.get('max_acceleration', DEFAULT_MAX_ACCELERATION))
+        self._max_dec = float(settings.get('max_deceleration', DEFAULT_MAX_DECELERATION))
+        self._update_graph()
+
     def _update_graph(self, skip_axis_adjustment=False):
         """그래프 다시 그리기
         
@@ -167,101 +339,212 @@ class GraphWindow(QMainWindow):
         if not self.graph_visible:
             return
         
-        # 기존 그래프 지우기 (범례 제외)
-        lines_to_remove = []
-        for line in self.ax.lines:
-            if line.get_label() not in ['Acceptable acc/dec range', 'Unacceptable acc/dec range']:
-                lines_to_remove.append(line)
-        
-        for line in lines_to_remove:
-            line.remove()
-        
+        # 모든 시리즈가 영속 아티스트이므로 제거/재생성 없이 set_data로만 갱신
+
         # X축, Y축 범위 자동 조정 (드래그 중이 아닐 때만)
         if not skip_axis_adjustment:
             self._adjust_axis_ranges()
         
-        # 새 데이터로 그래프 그리기
-        if self.optimization_data:
-            times = [point['time'] for point in self.optimization_data]
-            velocities = [point['velocity'] for point in self.optimization_data]
-            
-            # 가속도에 따른 선분 색상 그리기
-            settings = self.data_bridge.get_settings() if self.data_bridge else {}
-            max_acc = settings.get('max_acceleration', DEFAULT_MAX_ACCELERATION)
-            max_dec = settings.get('max_deceleration', DEFAULT_MAX_DECELERATION)
-            
-            # 각 선분을 가속도에 따라 다른 색상으로 그리기
-            for i in range(len(self.optimization_data) - 1):
-                curr_point = self.optimization_data[i]
-                next_point = self.optimization_data[i + 1]
-                
-                time_diff = next_point['time'] - curr_point['time']
-                if time_diff > 0:
-                    # 가속도 계산 (km/h를 m/s로 변환)
-                    vel_diff_ms = (next_point['velocity'] - curr_point['velocity']) / 3.6
-                    acceleration = vel_diff_ms / time_diff
-                    
-                    # 가속도 범위에 따른 색상 결정
-                    if max_dec <= acceleration <= max_acc:
-                        color = ACCELERATION_VALID_COLOR
-                    else:
-                        color = ACCELERATION_INVALID_COLOR
-                else:
-                    color = OPTIMIZATION_VELOCITY_COLOR
-                
-                # 선분 그리기
-                self.ax.plot([curr_point['time'], next_point['time']], 
-                           [curr_point['velocity'], next_point['velocity']],
-                           color=color, linewidth=LINE_WIDTH)
-            
-            # 포인트 그리기
-            self.ax.plot(times, velocities, 
-                        color=OPTIMIZATION_VELOCITY_COLOR,
-                        marker='o', markersize=POINT_SIZE,
-                        linewidth=0, fillstyle='none',
-                        label='Optimization Velocity')
-            
-            # 드래그 중인 포인트 강조
-            if self.dragging and self.selected_point_index is not None:
-                # 인덱스 유효성 검사
-                if 0 <= self.selected_point_index < len(self.optimization_data):
-                    selected_point = self.optimization_data[self.selected_point_index]
-                    self.ax.plot(selected_point['time'], selected_point['velocity'],
-                                'ro', markersize=POINT_SIZE * 1.5, zorder=10)
-                else:
-                    # 무효한 인덱스인 경우 드래그 상태 초기화
-                    self.dragging = False
-                    self.selected_point_index = None
-            
-            # 속도 라벨 추가
-            self._add_velocity_labels()
-        
-        if self.video_analysis_data:
-            times = [point['time'] for point in self.video_analysis_data]
-            velocities = [point['velocity'] for point in self.video_analysis_data]
-            
-            self.ax.step(times, velocities,
-                        color=VIDEO_ANALYSIS_VELOCITY_COLOR,
-                        label='Video Analysis Velocity',
-                        marker='s', markersize=POINT_SIZE,
-                        linewidth=LINE_WIDTH, fillstyle='none',
-                        where='post')
-        
-        if self.ground_truth_data:
-            times = [point['time'] for point in self.ground_truth_data]
-            velocities = [point['velocity'] for point in self.ground_truth_data]
-            
-            self.ax.plot(times, velocities,
-                        color=GROUND_TRUTH_VELOCITY_COLOR,
-                        label='Ground Truth Velocity',
-                        linestyle='--', linewidth=LINE_WIDTH)
-        
-        # 범례 업데이트
-        self.ax.legend()
-        
-        # 캔버스 다시 그리기
+        # 새 데이터로 그래프 그리기 (SoA 캐시 사용 - dict 순회 없음)
+        if self._opt_t is not None and self._opt_t.size:
+            # 선분 컬렉션 / 포인트 / 선택 마커 / 라벨 갱신 (드래그 블리팅과 공유)
+            self._refresh_optimization_artists(self._opt_t, self._opt_v)
+
+        else:
+            # 데이터가 비면 잔상 아티스트 제거
+            if self._seg_lc is not None:
+                self._seg_lc.set_segments([])
+            self._opt_line.set_data([], [])
+            self._sel_marker.set_data([], [])
+            self._add_velocity_labels(None, None)
+
+        if self._va_t is not None and self._va_t.size:
+            self._va_step.set_data(self._va_t, self._va_v)
+            self._va_step.set_visible(True)
+        else:
+            self._va_step.set_data([], [])
+
+        if self._gt_t is not None and self._gt_t.size:
+            self._gt_line.set_data(*self._decimate_for_display(self._gt_t, self._gt_v))
+            self._gt_line.set_visible(True)
+        else:
+            self._gt_line.set_data([], [])
+
+        # 캔버스 다시 그리기 예약 - 연속 호출은 이벤트 루프에서 한 번으로 병합됨
+        self.canvas.draw_idle()
+
+    def _decimate_for_display(self, t, v):
+        """픽셀 열 단위 min/max 보존 다운샘플링 (M4 방식)
+
+        포인트 수가 축 픽셀 폭의 4배를 넘을 때만 적용. 픽셀 열마다
+        (첫, 최소, 최대, 끝) 네 값만 남기므로 화면상 모양은 유지하면서
+        렌더러가 처리할 정점 수를 픽셀 폭에 비례하게 제한한다.
+        원본 배열은 그대로 유지된다 (표시 전용 축약).
+        """
+        try:
+            n_px = int(self.ax.get_window_extent().width)
+        except Exception:
+            return t, v
+        if n_px <= 0 or t.size <= 4 * n_px:
+            return t, v
+
+        # 현재 보이는 구간만 대상 (시간축은 정렬 상태)
+        x_min, x_max = self.ax.get_xlim()
+        i0 = np.searchsorted(t, x_min, side='left')
+        i1 = np.searchsorted(t, x_max, side='right')
+        t = t[i0:i1]
+        v = v[i0:i1]
+        if t.size <= 4 * n_px:
+            return t, v
+
+        # 픽셀 열별 버킷 경계 (빈 버킷 제거 후 연속 그룹으로 reduceat)
+        edges = np.linspace(x_min, x_max, n_px + 1)
+        starts = np.searchsorted(t, edges[:-1], side='left')
+        ends = np.append(starts[1:], t.size)
+        keep = ends > starts
+        starts = starts[keep]
+        ends = ends[keep]
+
+        v_min = np.minimum.reduceat(v, starts)
+        v_max = np.maximum.reduceat(v, starts)
+        t_first = t[starts]
+        t_last = t[ends - 1]
+
+        k = starts.size
+        out_t = np.empty(4 * k, dtype=np.float64)
+        out_v = np.empty(4 * k, dtype=np.float64)
+        out_t[0::4] = t_first
+        out_t[1::4] = t_first
+        out_t[2::4] = t_last
+        out_t[3::4] = t_last
+        out_v[0::4] = v[starts]
+        out_v[1::4] = v_min
+        out_v[2::4] = v_max
+        out_v[3::4] = v[ends - 1]
+        return out_t, out_v
+
+    def _on_xlim_changed(self, ax):
+        """줌/팬으로 보이는 구간이 바뀌면 GT 라인 다운샘플 갱신"""
+        if self._gt_t is not None and self._gt_t.size:
+            self._gt_line.set_data(*self._decimate_for_display(self._gt_t, self._gt_v))
+
+    def _refresh_optimization_artists(self, times, velocities):
+        """최적화 곡선 관련 아티스트 일괄 갱신
+
+        전체 다시 그리기(_update_graph)와 드래그 블리팅 경로가 공유한다.
+        """
+        # 구간별 가속도/색상을 벡터 연산으로 계산해 단일 LineCollection으로 그리기
+        max_acc = self._max_acc
+        max_dec = self._max_dec
+
+        pts = np.column_stack([times, velocities])
+        segs = np.stack([pts[:-1], pts[1:]], axis=1)
+
+        # 시간축 차분은 데이터 갱신 시 계산해둔 캐시 재사용 (드래그 중 불변)
+        if self._dt is not None and self._dt.size == times.size - 1:
+            dt = self._dt
+        else:
+            dt = np.diff(times)
+
+        if graph_window_kernels.NUMBA_AVAILABLE:
+            # Numba 커널: 분류 루프를 네이티브 코드로 수행 후 색상 룩업
+            codes = np.empty(dt.size, dtype=np.int64)
+            graph_window_kernels.classify_segments(dt, velocities, max_acc, max_dec, codes)
+            colors = _SEG_COLOR_LUT[codes]
+        else:
+            acc = np.zeros(dt.size, dtype=np.float64)
+            np.divide(np.diff(velocities) / 3.6, dt, out=acc, where=dt > 0)
+
+            colors = np.empty((dt.size, 4), dtype=np.float64)
+            colors[:] = _VALID_RGBA
+            colors[(acc < max_dec) | (acc > max_acc)] = _INVALID_RGBA
+            colors[dt <= 0] = _OPTIMIZATION_RGBA
+
+        if self._seg_lc is None:
+            self._seg_lc = LineCollection(segs, colors=colors, linewidths=LINE_WIDTH)
+            self._seg_lc.set_rasterized(True)
+            self.ax.add_collection(self._seg_lc)
+        else:
+            self._seg_lc.set_segments(segs)
+            self._seg_lc.set_color(colors)
+            self._seg_lc.set_visible(True)
+
+        # 포인트 갱신 - 포인트가 많으면 채운 마커로 전환 (렌더링 경로가 더 저렴)
+        filled = times.size > _FILLED_MARKER_THRESHOLD
+        if filled != self._opt_markers_filled:
+            self._opt_markers_filled = filled
+            self._opt_line.set_markerfacecolor(
+                OPTIMIZATION_VELOCITY_COLOR if filled else 'none'
+            )
+        self._opt_line.set_data(times, velocities)
+
+        # 드래그 중인 포인트 강조
+        if self.dragging and self.selected_point_index is not None:
+            if 0 <= self.selected_point_index < times.size:
+                self._sel_marker.set_data([times[self.selected_point_index]],
+                                          [velocities[self.selected_point_index]])
+            else:
+                # 무효한 인덱스인 경우 드래그 상태 초기화
+                self.dragging = False
+                self.selected_point_index = None
+                self._sel_marker.set_data([], [])
+        else:
+            self._sel_marker.set_data([], [])
+
+        # 속도 라벨 갱신
+        self._add_velocity_labels(times, velocities)
+
+    # === 드래그 블리팅 ===
+
+    def _on_canvas_draw(self, event):
+        """전체 draw 완료 후 배경 캐시 동기화 (리사이즈·줌·툴바 조작 대응)
+
+        드래그 중 전체 draw가 발생하면 (움직이는 아티스트는 animated라
+        배경에 포함되지 않으므로) 새 배경을 바로 다시 뜨고, 그 외에는
+        캐시를 무효화해 다음 드래그 시작 시 재캡처하게 한다.
+        """
+        if self.dragging and self._bg is not None:
+            self._bg = self.canvas.copy_from_bbox(self.ax.bbox)
+        else:
+            self._bg = None
+
+        # 리사이즈/줌으로 데이터→픽셀 변환이 바뀌었을 수 있으므로 히트 테스트 캐시 무효화
+        self._opt_disp = None
+
+    def _drag_artists(self):
+        """드래그 중 움직이는 아티스트 목록"""
+        artists = [self._seg_lc, self._opt_line] + self.velocity_labels + [self._sel_marker]
+        return [a for a in artists if a is not None]
+
+    def _capture_drag_background(self):
+        """정적 배경 캡처 - 움직이는 아티스트는 animated로 빼고 한 번 그린다"""
+        for artist in self._drag_artists():
+            artist.set_animated(True)
         self.canvas.draw()
-    
+        self._bg = self.canvas.copy_from_bbox(self.ax.bbox)
+
+    def _end_drag_blit(self):
+        """드래그 종료 - 블리팅 상태 해제"""
+        for artist in self._drag_artists():
+            artist.set_animated(False)
+        self._bg = None
+
+    def _draw_drag_frame(self):
+        """드래그 한 프레임 그리기 - 배경 복원 후 움직인 아티스트만 블릿"""
+        if self._bg is None:
+            self._capture_drag_background()
+
+        self._refresh_optimization_artists(self._opt_t, self._opt_v)
+
+        # 프레임당 반복되는 속성 조회는 지역 변수로 끌어올림 (60Hz+ 경로)
+        canvas = self.canvas
+        draw_artist = self.ax.draw_artist
+
+        canvas.restore_region(self._bg)
+        for artist in self._drag_artists():
+            draw_artist(artist)
+        canvas.blit(self.ax.bbox)
+
     # === 마우스 이벤트 핸들러 ===
     
     def _on_mouse_press(self, event):
@@ -273,32 +556,44 @@ class GraphWindow(QMainWindow):
         if not self.optimization_data:
             return
         
-        # 클릭 위치에서 가장 가까운 포인트 찾기
-        click_x, click_y = event.xdata, event.ydata
-        min_distance = float('inf')
-        closest_index = None
-        
-        for i, point in enumerate(self.optimization_data):
-            # 거리 계산 (x축은 시간 단위, y축은 속도 단위로 정규화)
-            x_dist = (point['time'] - click_x) * 10  # 시간축 가중치
-            y_dist = (point['velocity'] - click_y)   # 속도축
-            distance = (x_dist**2 + y_dist**2)**0.5
-            
-            if distance < min_distance:
-                min_distance = distance
-                closest_index = i
-        
+        if self._opt_t is None or self._opt_t.size == 0:
+            return
+
+        # 클릭 위치에서 가장 가까운 포인트 찾기 - 픽셀 좌표계에서 벡터화된 argmin
+        # (데이터 좌표 가중치 대신 화면 거리를 쓰므로 축 스케일 변화에 불변)
+        if self._opt_disp is None:
+            self._opt_disp = self.ax.transData.transform(
+                np.column_stack([self._opt_t, self._opt_v])
+            )
+        dx = self._opt_disp[:, 0] - event.x
+        dy = self._opt_disp[:, 1] - event.y
+        d2 = dx * dx + dy * dy  # 단조 함수인 sqrt는 생략
+        closest_index = int(np.argmin(d2))
+
         # 임계값 내에 있으면 드래그 시작
-        threshold = 5.0  # 클릭 감지 임계값
-        if min_distance < threshold and closest_index is not None:
+        threshold = 15.0  # 클릭 감지 임계값 (픽셀)
+        if d2[closest_index] < threshold * threshold:
             self.dragging = True
             self.selected_point_index = closest_index
+            self._last_motion_y = None
     
     def _on_mouse_release(self, event):
         """마우스 릴리즈 이벤트"""
         if self.dragging:
+            # 아직 반영되지 않은 마지막 이동을 먼저 적용
+            if self._redraw_timer.isActive():
+                self._redraw_timer.stop()
+                self._apply_pending_drag()
+            self._pending_y = None
+
             self.dragging = False
-            
+
+            # 블리팅 상태 해제 후 전체 다시 그리기로 복귀
+            self._end_drag_blit()
+
+            # 드래그 동안 SoA 캐시에만 반영된 변경을 dict API로 동기화
+            self._sync_back_to_dicts()
+
             # 드래그 완료 후 Y축 범위 재조정을 위해 그래프 업데이트
             self._update_graph(skip_axis_adjustment=False)
             
@@ -312,82 +607,107 @@ class GraphWindow(QMainWindow):
             self.selected_point_index = None
     
     def _on_mouse_motion(self, event):
-        """마우스 이동 이벤트 - 앵커 기반 전체 업데이트"""
+        """마우스 이동 이벤트 - 최신 좌표만 기록하고 타이머로 병합 처리"""
         if self.dragging and event.inaxes == self.ax and self.selected_point_index is not None:
-            # 새로운 Y 좌표 (속도값)으로 업데이트
-            new_velocity = max(0, event.ydata)  # 속도는 0 이상
-            
-            # 앵커 기반 전체 그래프 업데이트
-            if self.data_bridge:
-                # 드래그된 포인트에서 앵커 속도 역계산
-                anchor_velocity = self.data_bridge._reverse_calculate_anchor(
-                    self.selected_point_index, new_velocity
-                )
-                
-                # 앵커 기반으로 전체 최적화 데이터 재계산
-                updated_data = self.data_bridge._update_from_anchor_change(anchor_velocity)
-                
-                if updated_data:
-                    # 전체 optimization_data 업데이트
-                    self.optimization_data = updated_data
-                else:
-                    # 폴백: 기존 방식으로 개별 포인트만 업데이트
-                    self.optimization_data[self.selected_point_index]['velocity'] = new_velocity
-                
-                # 그래프 실시간 업데이트 (드래그 중에는 Y축 범위 조정 안함)
-                self._update_graph(skip_axis_adjustment=True)
+            # 픽셀 반올림으로 동일한 Y 좌표가 연속 도착하면 아무것도 하지 않음
+            if event.ydata == self._last_motion_y:
+                return
+            self._last_motion_y = event.ydata
+
+            # 이벤트당 redraw 대신 최신 Y 좌표만 갱신 (타이머가 한 번에 처리)
+            self._pending_y = event.ydata
+            if not self._redraw_timer.isActive():
+                self._redraw_timer.start()
+
+    def _apply_pending_drag(self):
+        """병합된 드래그 업데이트 적용 - 마지막 마우스 좌표 기준"""
+        if not self.dragging or self._pending_y is None or self.selected_point_index is None:
+            return
+
+        # 새로운 Y 좌표 (속도값)으로 업데이트
+        new_velocity = max(0, self._pending_y)  # 속도는 0 이상
+
+        # 앵커 기반 전체 그래프 업데이트
+        if self.data_bridge:
+            # 드래그된 포인트에서 앵커 속도 역계산
+            anchor_velocity = self.data_bridge._reverse_calculate_anchor(
+                self.selected_point_index, new_velocity
+            )
+
+            # 앵커 기반으로 전체 최적화 데이터 재계산
+            updated_data = self.data_bridge._update_from_anchor_change(anchor_velocity)
+
+            if updated_data:
+                # 드래그 중에는 SoA 캐시만 갱신 - dict 동기화는 릴리즈 시점에
+                self._opt_t, self._opt_v = self._to_soa(updated_data)
+            elif self.selected_point_index < self._opt_v.size:
+                # 폴백: 같은 시각의 경계 포인트(구간 끝 = 다음 구간 시작)를
+                # 함께 갱신해 곡선 연속성 유지. 시간축이 정렬돼 있으므로
+                # 전체 마스크 대신 이분 탐색으로 일치 구간만 찾는다
+                t_sel = self._opt_t[self.selected_point_index]
+                lo = np.searchsorted(self._opt_t, t_sel - 1e-3, side='left')
+                hi = np.searchsorted(self._opt_t, t_sel + 1e-3, side='right')
+                self._opt_v[lo:hi] = new_velocity
+
+            # 드래그 실시간 업데이트 - 전체 redraw 대신 배경 복원 + 블릿
+            self._draw_drag_frame()
     
     # === 속도 라벨 메서드 ===
     
-    def _add_velocity_labels(self):
-        """모든 데이터 포인트 위에 속도 라벨 추가"""
-        # 기존 라벨 제거
-        for label in self.velocity_labels:
-            label.remove()
-        self.velocity_labels.clear()
-        
-        if not self.optimization_data:
-            return
-        
-        # 각 포인트에 라벨 추가 (위쪽에만)
-        for i, point in enumerate(self.optimization_data):
-            # 모든 라벨을 위쪽에만 표시
-            y_offset = 10  # 기존 5에서 10으로 (2배)
-            va = 'bottom'
-            
-            # 소수점 둘째자리까지 표시 (숫자만)
-            label_text = f'{point["velocity"]:.2f}'
-            
-            # 라벨 생성
-            label = self.ax.annotate(
-                label_text,
-                xy=(point['time'], point['velocity']),
-                xytext=(0, y_offset),
-                textcoords='offset points',
-                ha='center',
-                va=va,
-                fontsize=9,
-                color='black',  # 검은색으로 변경
-                fontweight='normal',
-                zorder=15  # 포인트보다 위에 표시
-            )
-            
-            self.velocity_labels.append(label)
+    def _add_velocity_labels(self, times, velocities):
+        """모든 데이터 포인트 위에 속도 라벨 추가/갱신
+
+        포인트 수가 같으면 기존 annotation을 재사용하고 위치/텍스트만
+        갱신한다 (드래그 중 매 프레임 재생성 방지).
+        """
+        n = 0 if times is None else times.size
+
+        # 포인트 수가 달라졌을 때만 라벨 재생성
+        if len(self.velocity_labels) != n:
+            for label in self.velocity_labels:
+                label.remove()
+            self.velocity_labels.clear()
+
+            for i in range(n):
+                # 모든 라벨을 위쪽에만 표시
+                y_offset = 10  # 기존 5에서 10으로 (2배)
+
+                label = self.ax.annotate(
+                    '',
+                    xy=(0, 0),
+                    xytext=(0, y_offset),
+                    textcoords='offset points',
+                    ha='center',
+                    va='bottom',
+                    fontsize=9,
+                    color='black',  # 검은색으로 변경
+                    fontweight='normal',
+                    zorder=15  # 포인트보다 위에 표시
+                )
+                self.velocity_labels.append(label)
+
+        # 위치/텍스트 갱신 (소수점 둘째자리까지, 숫자만)
+        # 드래그 중 매 프레임 도는 루프 - 리스트 조회를 지역에 바인딩
+        labels = self.velocity_labels
+        for i in range(n):
+            label = labels[i]
+            label.xy = (times[i], velocities[i])
+            label.set_text(f'{velocities[i]:.2f}')
     
     # === 버튼 이벤트 핸들러 ===
     
     def _toggle_graph_visibility(self):
-        """그래프 표시/숨김 토글"""
+        """그래프 표시/숨김 토글 - 축 전체를 한 번에 토글"""
         self.graph_visible = not self.graph_visible
-        
+
+        # 아티스트별 순회 대신 Axes 가시성 플래그 하나로 처리
+        self.ax.set_visible(self.graph_visible)
+
         if self.graph_visible:
             self._update_graph()
             self.show_graph_button.setText('HIDE GRAPH')
         else:
-            # 모든 라인 숨기기
-            for line in self.ax.lines:
-                line.set_visible(False)
-            self.canvas.draw()
+            self.canvas.draw_idle()
             self.show_graph_button.setText('SHOW GRAPH')
     
     def _upload_ground_truth(self):
@@ -412,8 +732,9 @@ class GraphWindow(QMainWindow):
         
         if file_path:
             try:
-                self.figure.savefig(file_path, dpi=300, bbox_inches='tight')
-                self._show_info_message("이미지 저장", f"PNG 파일로 저장했습니다:\n{file_path}")
+                buf = io.BytesIO()
+                self.figure.savefig(buf, format='png', dpi=300)
+                self._start_save_task(file_path, buf.getvalue(), 'PNG')
             except Exception as e:
                 self._show_error_message("저장 오류", f"PNG 저장 중 오류: {e}")
     
@@ -425,49 +746,75 @@ class GraphWindow(QMainWindow):
         
         if file_path:
             try:
-                self.figure.savefig(file_path, format='svg', bbox_inches='tight')
-                self._show_info_message("이미지 저장", f"SVG 파일로 저장했습니다:\n{file_path}")
+                # 벡터 출력은 래스터 캐시를 잠시 해제해 순수 SVG로 저장
+                rasterized = [a for a in (self._opt_line, self._va_step,
+                                          self._gt_line, self._seg_lc)
+                              if a is not None]
+                for artist in rasterized:
+                    artist.set_rasterized(False)
+                try:
+                    buf = io.BytesIO()
+                    self.figure.savefig(buf, format='svg')
+                finally:
+                    for artist in rasterized:
+                        artist.set_rasterized(True)
+                self._start_save_task(file_path, buf.getvalue(), 'SVG')
             except Exception as e:
                 self._show_error_message("저장 오류", f"SVG 저장 중 오류: {e}")
+
+    def _start_save_task(self, file_path, payload, save_format):
+        """렌더링된 바이트를 백그라운드 스레드로 저장 (GUI 스레드 비차단)"""
+        self.save_png_button.setEnabled(False)
+        self.save_svg_button.setEnabled(False)
+
+        task = _SaveTask(file_path, payload)
+        task.signals.finished.connect(
+            lambda ok, msg: self._on_save_finished(ok, msg, save_format)
+        )
+        QThreadPool.globalInstance().start(task)
+
+    def _on_save_finished(self, ok, msg, save_format):
+        """백그라운드 저장 완료 처리"""
+        self.save_png_button.setEnabled(True)
+        self.save_svg_button.setEnabled(True)
+
+        if ok:
+            self._show_info_message("이미지 저장", f"{save_format} 파일로 저장했습니다:\n{msg}")
+        else:
+            self._show_error_message("저장 오류", f"{save_format} 저장 중 오류: {msg}")
     
     # === 유틸리티 메서드 ===
     
+    @staticmethod
+    def _series_extent(t, v):
+        """시리즈 범위 튜플 (t_min, t_max, v_min, v_max) 계산 - 빈 시리즈는 None"""
+        if t is None or t.size == 0:
+            return None
+        return (float(t.min()), float(t.max()), float(v.min()), float(v.max()))
+
     def _adjust_axis_ranges(self):
-        """X축, Y축 범위 자동 조정"""
+        """X축, Y축 범위 자동 조정 - 시리즈별 범위 캐시 결합 (O(1))"""
         try:
-            # 모든 데이터의 시간과 속도 값 수집
-            all_times = []
-            all_velocities = []
-            
-            if self.optimization_data:
-                all_times.extend([point['time'] for point in self.optimization_data])
-                all_velocities.extend([point['velocity'] for point in self.optimization_data])
-            if self.video_analysis_data:
-                all_times.extend([point['time'] for point in self.video_analysis_data])
-                all_velocities.extend([point['velocity'] for point in self.video_analysis_data])
-            if self.ground_truth_data:
-                all_times.extend([point['time'] for point in self.ground_truth_data])
-                all_velocities.extend([point['velocity'] for point in self.ground_truth_data])
-            
+            extents = [e for e in self._extents.values() if e is not None]
+
             # X축 범위 조정 (시간)
-            if all_times:
-                min_time = min(all_times)
-                max_time = max(all_times)
-                
+            if extents:
+                max_time = max(e[1] for e in extents)
+
                 # 시간 시작점은 항상 0부터, 끝점은 최대 시간값 + 약간의 여유
                 time_margin = max_time * 0.05 if max_time > 0 else 1.0  # 5% 여유
                 x_min = 0
                 x_max = max_time + time_margin
-                
+
                 # X축 범위 설정
                 self.ax.set_xlim(x_min, x_max)
             else:
                 # 데이터가 없으면 기본 X축 범위
                 self.ax.set_xlim(0, 20)
-            
+
             # Y축 범위 조정 (항상 0부터 시작, 최고점이 Y축의 80% 지점에 오도록)
-            if all_velocities:
-                max_vel = max(all_velocities)
+            if extents:
+                max_vel = max(e[3] for e in extents)
                 
                 # Y축 하단은 항상 0
                 y_min = 0
@@ -506,34 +853,37 @@ class GraphWindow(QMainWindow):
     def _validate_velocity_change(self, point_index, new_velocity):
         """속도 변경 시 가속도 제한 검증"""
         try:
-            # 인접 포인트들과의 가속도 계산
-            settings = self.data_bridge.get_settings() if self.data_bridge else {}
-            max_acc = settings.get('max_acceleration', DEFAULT_MAX_ACCELERATION)
-            max_dec = settings.get('max_deceleration', DEFAULT_MAX_DECELERATION)
-            
-            # 이전 포인트와의 가속도 검증
+            # 인접 포인트들과의 가속도 계산 (캐시된 설정값 사용)
+            max_acc = self._max_acc
+            max_dec = self._max_dec
+
+            if graph_window_kernels.NUMBA_AVAILABLE:
+                return bool(graph_window_kernels.validate_change(
+                    self._dt, self._opt_v, point_index,
+                    float(new_velocity), max_acc, max_dec
+                ))
+
+            # 이전 포인트와의 가속도 검증 (차분 캐시 사용)
             if point_index > 0:
-                prev_point = self.optimization_data[point_index - 1]
-                time_diff = self.optimization_data[point_index]['time'] - prev_point['time']
-                
+                time_diff = self._dt[point_index - 1]
+
                 if time_diff > 0:
                     # km/h를 m/s로 변환하여 가속도 계산
-                    vel_diff_ms = (new_velocity - prev_point['velocity']) / 3.6
+                    vel_diff_ms = (new_velocity - self._opt_v[point_index - 1]) / 3.6
                     acceleration = vel_diff_ms / time_diff
-                    
+
                     if acceleration > max_acc or acceleration < max_dec:
                         return False
-            
+
             # 다음 포인트와의 가속도 검증
-            if point_index < len(self.optimization_data) - 1:
-                next_point = self.optimization_data[point_index + 1]
-                time_diff = next_point['time'] - self.optimization_data[point_index]['time']
-                
+            if point_index < self._opt_t.size - 1:
+                time_diff = self._dt[point_index]
+
                 if time_diff > 0:
                     # km/h를 m/s로 변환하여 가속도 계산
-                    vel_diff_ms = (next_point['velocity'] - new_velocity) / 3.6
+                    vel_diff_ms = (self._opt_v[point_index + 1] - new_velocity) / 3.6
                     acceleration = vel_diff_ms / time_diff
-                    
+
                     if acceleration > max_acc or acceleration < max_dec:
                         return False
             
@@ -0,0 +1,64 @@
+"""
+GraphWindowKernels - 그래프 수치 커널 모듈
+드래그 검증/구간 색상 분류 핫패스 (Numba 설치 시 네이티브 컴파일)
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Numba 미설치 시 데코레이터 무시 (순수 Python 경로)"""
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrapper(func):
+            return func
+        return wrapper
+
+
+@njit(cache=True, fastmath=True)
+def classify_segments(dt, v, max_acc, max_dec, out):
+    """구간별 가속도 분류 코드 기록
+
+    dt는 호출 측에서 캐시한 시간축 차분 배열 (np.diff(t)).
+    out[i]: 0=허용 범위, 1=범위 초과, 2=dt<=0 (기본 색)
+    """
+    for i in range(dt.size):
+        d = dt[i]
+        if d > 0:
+            a = (v[i + 1] - v[i]) / 3.6 / d
+            out[i] = 0 if (max_dec <= a <= max_acc) else 1
+        else:
+            out[i] = 2
+
+
+@njit(cache=True)
+def validate_change(dt, v, idx, new_v, max_acc, max_dec):
+    """포인트 속도 변경이 인접 구간 가속도 제한을 지키는지 검사"""
+    if idx > 0:
+        d = dt[idx - 1]
+        if d > 0:
+            a = (new_v - v[idx - 1]) / 3.6 / d
+            if a > max_acc or a < max_dec:
+                return False
+    if idx < v.size - 1:
+        d = dt[idx]
+        if d > 0:
+            a = (v[idx + 1] - new_v) / 3.6 / d
+            if a > max_acc or a < max_dec:
+                return False
+    return True
+
+
+if NUMBA_AVAILABLE:
+    # 임포트 시점에 한 번 컴파일해 첫 호출 지연 제거 (cache=True로 재기동 시 AOT 재사용)
+    _warm_dt = np.zeros(1, dtype=np.float64)
+    _warm_v = np.zeros(2, dtype=np.float64)
+    _warm_out = np.zeros(1, dtype=np.int64)
+    classify_segments(_warm_dt, _warm_v, 1.0, -1.0, _warm_out)
+    validate_change(_warm_dt, _warm_v, 0, 0.0, 1.0, -1.0)
@@ -3,15 +3,39 @@
 영상기반 속도분석 한계 극복을 위한 사용자 주도형 속도 최적화 기법
 """
 
+import atexit
+import logging
+import logging.handlers
 import sys
 from PyQt5.QtWidgets import QApplication
 from PyQt5.QtCore import Qt
 
 from velocity_optimizer import VelocityOptimizer
 
+def setup_logging():
+    """로깅 설정 - 파일 기록은 버퍼링으로 묶어 레코드당 I/O 제거"""
+    log_format = '%(asctime)s %(name)s %(levelname)s %(message)s'
+    # delay=True: 첫 기록 전에는 파일을 열지 않음
+    file_handler = logging.FileHandler('speed_graph.log', encoding='utf-8', delay=True)
+    # 플러시 시 target 핸들러의 포매터로 다시 포맷되므로 명시적으로 지정
+    file_handler.setFormatter(logging.Formatter(log_format))
+    # 1000건씩 모아서 기록, ERROR 이상은 즉시 플러시
+    memory_handler = logging.handlers.MemoryHandler(
+        capacity=1000, flushLevel=logging.ERROR, target=file_handler
+    )
+    logging.basicConfig(
+        level=logging.INFO,
+        format=log_format,
+        handlers=[memory_handler, logging.StreamHandler(sys.stdout)]
+    )
+    # 종료 시 버퍼에 남은 레코드 유실 방지
+    atexit.register(memory_handler.flush)
+
 def main():
     """메인 함수"""
     try:
+        setup_logging()
+
         # High DPI 지원 (QApplication 생성 전에 설정)
         QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
         QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)